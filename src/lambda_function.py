@@ -1,9 +1,30 @@
+from __future__ import annotations
+
 import json
+from typing import TYPE_CHECKING
+
+import orjson
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.utilities.typing import LambdaContext
 from pydantic import BaseModel, ValidationError
 
-logger = Logger()
+if TYPE_CHECKING:
+    # Only needed for the handler annotation; keep it off the cold-start path
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def _log_serializer(log: dict) -> str:
+    """Serialize Powertools log records with orjson"""
+    try:
+        return orjson.dumps(log, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects ints wider than 64 bits; never drop a log line
+        return json.dumps(log, default=str, separators=(",", ":"))
+
+
+logger = Logger(json_serializer=_log_serializer, json_deserializer=orjson.loads)
+
+# Static response bodies, encoded once at import
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error"}).decode()
 
 
 class User(BaseModel):
@@ -13,37 +34,61 @@ class User(BaseModel):
     age: int
 
 
+def _invalid_input_body(error: ValidationError) -> str:
+    """Encode the 400 response body for a validation error"""
+    # Clients only need type/loc/msg; skip the docs URL, context and echoed
+    # input, and cap the list so large payloads stay cheap to report
+    details = error.errors(include_url=False, include_context=False, include_input=False)[:3]
+    return orjson.dumps({"error": "Invalid input", "details": details}).decode()
+
+
+def _build_empty_input_error() -> tuple[str, str]:
+    """Validate an empty object once so its log text and 400 body can be reused"""
+    try:
+        User.model_validate({})
+    except ValidationError as e:
+        return str(e), _invalid_input_body(e)
+    raise RuntimeError("User unexpectedly accepts an empty body")
+
+
+_EMPTY_INPUT_ERROR, _EMPTY_INPUT_ERROR_BODY = _build_empty_input_error()
+
+
 def lambda_handler(event: dict, context: LambdaContext) -> dict:
     """
     Lambda handler to create a user
     """
     try:
         # Parse body
-        body = json.loads(event.get("body", "{}"))
+        body = orjson.loads(event.get("body") or "{}")
+        
+        # An empty object can never be a valid User: answer with the
+        # pre-built 400 instead of raising a ValidationError
+        if isinstance(body, dict) and not body:
+            logger.error("Validation error", extra={"error": _EMPTY_INPUT_ERROR})
+            return {"statusCode": 400, "body": _EMPTY_INPUT_ERROR_BODY}
         
-        # Validate with Pydantic
-        user = User(**body)
+        # Validate with Pydantic (reuses the class's compiled validator,
+        # no kwargs unpacking)
+        user = User.model_validate(body)
         
         logger.info("User created", extra={"user": user.model_dump()})
         
         return {
             "statusCode": 201,
-            "body": json.dumps({
-                "message": "User created successfully",
-                "user": user.model_dump()
-            })
+            "body": '{"message":"User created successfully","user":' + user.model_dump_json() + "}"
         }
         
     except ValidationError as e:
         logger.error("Validation error", extra={"error": str(e)})
         return {
             "statusCode": 400,
-            "body": json.dumps({"error": "Invalid input", "details": e.errors()})
+            "body": _invalid_input_body(e)
         }
         
     except Exception as e:
         logger.error("Unexpected error", extra={"error": str(e)})
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": "Internal server error"})
+            "body": _INTERNAL_ERROR_BODY
         }
\ No newline at end of file
@@ -1,84 +1,109 @@
 import pytest
 import json
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Any
 
 
-@pytest.fixture(autouse=True)
+# Test payloads are never mutated, so build and serialize them once
+_VALID_USER = {
+    "name": "John Doe",
+    "email": "john@example.com",
+    "age": 30
+}
+_INVALID_USER = {
+    "name": "Jane Doe",
+    "age": 25
+}
+_VALID_USER_BODY = json.dumps(_VALID_USER)
+_INVALID_USER_BODY = json.dumps(_INVALID_USER)
+
+# Read-only base event; fixtures derive fresh dicts from it
+_BASE_EVENT = MappingProxyType({
+    "resource": "/users",
+    "path": "/users",
+    "httpMethod": "POST",
+    "headers": MappingProxyType({
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    }),
+    "queryStringParameters": None,
+    "pathParameters": None,
+    "body": None,
+    "isBase64Encoded": False
+})
+
+
+_FAKE_AWS_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": "us-east-1",
+}
+
+
+@pytest.fixture(autouse=True, scope="session")
 def aws_credentials():
-    """Set fake AWS credentials for testing"""
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+    """Force fake AWS credentials for the session, restoring local ones after"""
+    saved = {key: os.environ.get(key) for key in _FAKE_AWS_ENV}
+    os.environ.update(_FAKE_AWS_ENV)
+    
+    yield
+    
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
 
 
-@pytest.fixture
+@dataclass(slots=True, frozen=True)
+class MockLambdaContext:
+    """Immutable stand-in for the Lambda context object"""
+    function_name: str = "test-function"
+    memory_limit_in_mb: int = 128
+    invoked_function_arn: str = "arn:aws:lambda:us-east-1:123456789012:function:test-function"
+    aws_request_id: str = "test-request-id"
+
+
+@pytest.fixture(scope="session")
 def lambda_context():
-    """Create a mock Lambda context"""
-    class MockContext:
-        function_name = "test-function"
-        memory_limit_in_mb = 128
-        invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:test-function"
-        aws_request_id = "test-request-id"
-        
-    return MockContext()
+    """Create a mock Lambda context (shared, it is read-only)"""
+    return MockLambdaContext()
 
 
 @pytest.fixture
 def api_gateway_event():
-    """Basic API Gateway event structure"""
-    return {
-        "resource": "/users",
-        "path": "/users",
-        "httpMethod": "POST",
-        "headers": {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        },
-        "queryStringParameters": None,
-        "pathParameters": None,
-        "body": None,
-        "isBase64Encoded": False
-    }
+    """Basic API Gateway event structure (mutable copy of the base event)"""
+    return {**_BASE_EVENT, "headers": dict(_BASE_EVENT["headers"])}
 
 
 @pytest.fixture
 def valid_user_data():
     """Valid user data for testing"""
-    return {
-        "name": "John Doe",
-        "email": "john@example.com",
-        "age": 30
-    }
+    return dict(_VALID_USER)
 
 
 @pytest.fixture
 def invalid_user_data():
     """Invalid user data (missing email)"""
-    return {
-        "name": "Jane Doe",
-        "age": 25
-    }
+    return dict(_INVALID_USER)
 
 
 @pytest.fixture
-def api_event_with_valid_user(api_gateway_event, valid_user_data):
+def api_event_with_valid_user(api_gateway_event):
     """
     Complex fixture that USES other fixtures!
-    This combines api_gateway_event + valid_user_data
+    This combines api_gateway_event + the pre-serialized valid user
     """
-    event = api_gateway_event.copy()
-    event["body"] = json.dumps(valid_user_data)
-    return event
+    return {**api_gateway_event, "body": _VALID_USER_BODY}
 
 
 @pytest.fixture
-def api_event_with_invalid_user(api_gateway_event, invalid_user_data):
+def api_event_with_invalid_user(api_gateway_event):
     """
     Complex fixture for testing validation errors
     """
-    event = api_gateway_event.copy()
-    event["body"] = json.dumps(invalid_user_data)
-    return event
\ No newline at end of file
+    return {**api_gateway_event, "body": _INVALID_USER_BODY}
\ No newline at end of file
@@ -1,6 +1,6 @@
 import json
 import pytest
-from src.lambda_function import lambda_handler
+from src.lambda_function import _log_serializer, lambda_handler
 
 
 def test_create_user_success(api_event_with_valid_user, lambda_context):
@@ -52,4 +52,65 @@ def test_create_user_empty_body(api_gateway_event, lambda_context):
     response = lambda_handler(api_gateway_event, lambda_context)
     
     # Assert
-    assert response["statusCode"] == 400
\ No newline at end of file
+    assert response["statusCode"] == 400
+
+
+def test_create_user_empty_body_reports_missing_fields(api_gateway_event, lambda_context):
+    """Test the short-circuited empty body still lists every missing field"""
+    # Arrange
+    api_gateway_event["body"] = "{}"
+    
+    # Act
+    response = lambda_handler(api_gateway_event, lambda_context)
+    
+    # Assert
+    body = json.loads(response["body"])
+    assert body["error"] == "Invalid input"
+    assert {d["loc"][0] for d in body["details"]} == {"name", "email", "age"}
+
+
+def test_create_user_validation_error_details_are_trimmed(api_event_with_invalid_user, lambda_context):
+    """Test validation details omit the docs URL and echoed input"""
+    # Act
+    response = lambda_handler(api_event_with_invalid_user, lambda_context)
+    
+    # Assert
+    details = json.loads(response["body"])["details"]
+    assert 0 < len(details) <= 3
+    assert all("url" not in d and "input" not in d for d in details)
+
+
+def test_create_user_null_body(api_gateway_event, lambda_context):
+    """Test a missing/null body is treated as an empty object"""
+    # Act (the base event carries "body": None)
+    response = lambda_handler(api_gateway_event, lambda_context)
+    
+    # Assert
+    assert response["statusCode"] == 400
+
+
+def test_create_user_age_wider_than_64_bits(api_gateway_event, valid_user_data, lambda_context):
+    """Test an age wider than 64 bits is returned exactly instead of a 500"""
+    # Arrange
+    valid_user_data["age"] = "100000000000000000000"
+    api_gateway_event["body"] = json.dumps(valid_user_data)
+    
+    # Act
+    response = lambda_handler(api_gateway_event, lambda_context)
+    
+    # Assert
+    assert response["statusCode"] == 201
+    
+    body = json.loads(response["body"])
+    assert body["user"]["age"] == 10**20
+
+
+def test_log_serializer_handles_non_str_keys_and_wide_ints():
+    """Test log records orjson cannot encode natively are still serialized"""
+    # Act
+    non_str_keys = _log_serializer({1: "x"})
+    wide_int = _log_serializer({"a": 10**30, 1: "x"})
+    
+    # Assert
+    assert json.loads(non_str_keys) == {"1": "x"}
+    assert json.loads(wide_int) == {"a": 10**30, "1": "x"}